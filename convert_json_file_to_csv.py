@@ -1,25 +1,38 @@
 import sys
 from pathlib import Path
 
+from tsu_data.identity_functions import *
 from tsu_data.json_functions import *
 from tsu_data.output_functions import *
 
 if len(sys.argv) < 2:
-    print("Usage: uv run convert_json_file_to_csv.py <path_to_details_file>")
+    print(
+        "Usage: uv run convert_json_file_to_csv.py <path_to_details_file> "
+        "[path_to_identity_registry]"
+    )
     sys.exit(1)
 
 input_file_path = Path(sys.argv[1])
+# optional: reference drivers/vehicles by keys of a persistent identity registry
+registry_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+registry = load_identity_registry(registry_path) if registry_path else None
 
 
 data = read_event_json(input_file_path)
 s_event = get_event_series(data)
-df_drivers = get_driver_df(data)
+df_drivers = get_driver_df(data, registry)
 df_race_results = get_race_results_df(data)
 df_fastest_lap_results = get_fastest_lap_results_df(data)
 df_checkpoint_results = get_checkpoint_results_df(data)
 
 df_lap_results = extract_lap_results_from_cps(df_checkpoint_results, df_drivers)
 
+if registry is not None:
+    df_race_results = add_driver_keys(df_race_results, df_drivers)
+    df_fastest_lap_results = add_driver_keys(df_fastest_lap_results, df_drivers)
+    df_checkpoint_results = add_driver_keys(df_checkpoint_results, df_drivers)
+    df_lap_results = add_driver_keys(df_lap_results, df_drivers)
+
 # # output
 df_event = s_event.to_frame().T
 
@@ -29,3 +42,8 @@ write_df_to_csv(input_file_path, df_race_results, ".race-results")
 write_df_to_csv(input_file_path, df_fastest_lap_results, ".fastest-lap-results")
 write_df_to_csv(input_file_path, df_checkpoint_results, ".checkpoint-results")
 write_df_to_csv(input_file_path, df_lap_results, ".lap-results")
+
+if registry is not None:
+    save_identity_registry(registry, registry_path)
+    write_df_to_csv(registry_path, get_driver_dimension_df(registry), ".drivers")
+    write_df_to_csv(registry_path, get_vehicle_dimension_df(registry), ".vehicles")
@@ -1,23 +1,47 @@
 import sys
 from pathlib import Path
 
+from tsu_data.identity_functions import *
+from tsu_data.json_functions import get_driver_df, read_event_json
 from tsu_data.log_functions import *
 from tsu_data.output_functions import *
 
 if len(sys.argv) < 2:
-    print("Usage: uv run convert_log_file_to_csv.py <path_to_details_file>")
+    print(
+        "Usage: uv run convert_log_file_to_csv.py <path_to_details_file> "
+        "[path_to_identity_registry]"
+    )
     sys.exit(1)
 
 input_file_path = Path(sys.argv[1])
+# optional: reference drivers by keys of a persistent identity registry
+registry_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+registry = load_identity_registry(registry_path) if registry_path else None
+
+df_json_drivers = None
+if registry is not None:
+    # the json of the same event maps log player indices to driver keys reliably
+    json_file_path = input_file_path.with_name(
+        input_file_path.name.removesuffix(".details.log") + ".json"
+    )
+    if json_file_path.exists():
+        df_json_drivers = get_driver_df(read_event_json(json_file_path), registry)
 
 
 lines = read_event_log(input_file_path)
 
-df_drivers, df_compounds, max_fuel = parse_meta_data(lines)
+df_drivers, df_compounds, max_fuel = parse_meta_data(lines, registry, df_json_drivers)
 df_events, start_pos_by_driver_id = parse_events(lines, df_compounds, max_fuel)
 df_details = get_details_df(df_events, start_pos_by_driver_id)
 
+if registry is not None:
+    df_details = add_driver_keys(df_details, df_drivers, "driver_id", "driver_id")
+
 # output
 write_df_to_csv(input_file_path, df_details, ".main")
 write_df_to_csv(input_file_path, df_drivers, ".drivers")
 write_df_to_csv(input_file_path, df_compounds, ".compounds")
+
+if registry is not None:
+    save_identity_registry(registry, registry_path)
+    write_df_to_csv(registry_path, get_driver_dimension_df(registry), ".drivers")
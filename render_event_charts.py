@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+from tsu_data.file_functions import *
+from tsu_data.plot_functions import *
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: uv run render_event_charts.py <path_to_input_dir> [workers]")
+        sys.exit(1)
+
+    input_dir = Path(sys.argv[1])
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    pairs = find_event_pairs(input_dir)
+    results, errors = render_charts_batch(pairs, max_workers=max_workers)
+
+    for json_path, written in results.items():
+        print(f"{json_path.name}: {len(written)} chart(s) rendered")
+
+    for json_path, error in errors.items():
+        print(f"{json_path.name}: failed: {error}")
+
+    if errors:
+        print(f"{len(errors)} of {len(pairs)} event(s) failed")
+        sys.exit(1)
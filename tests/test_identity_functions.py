@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+from tsu_data.identity_functions import (
+    add_driver_keys,
+    new_identity_registry,
+    register_driver,
+    resolve_log_drivers,
+)
+from tsu_data.json_functions import get_driver_df
+from tsu_data.log_functions import parse_meta_data
+
+# three players on one steam id: host plus two AI (or split-screen) players
+LOG_LINES = [
+    "PlayerCount 3\n",
+    "# Format: <index> <id> <team> <name>\n",
+    "\n",
+    "0 76561197989276622 0 [ABC] Host\n",
+    "1 76561197989276622 0 Bot Alpha\n",
+    "2 76561197989276622 0 Bot Beta\n",
+    "\n",
+    "Events\n",
+]
+
+
+def _json_data():
+    players = [
+        ("Host", "ABC", 0, False),
+        ("Bot Alpha", "", 0, True),
+        ("Bot Beta", "", 0, True),
+    ]
+    return {
+        "players": [
+            {
+                "player": {
+                    "name": name,
+                    "id": 76561197989276622,
+                    "localIndex": local_index,
+                    "ai": ai,
+                    "clan": clan,
+                    "flag": "Germany",
+                },
+                "vehicle": {"name": "Grand Prix F1 v8", "guid": "xn6aadw6r6b"},
+                "startPosition": i + 1,
+            }
+            for i, (name, clan, local_index, ai) in enumerate(players)
+        ]
+    }
+
+
+def test_shared_steam_id_gets_distinct_keys_from_json():
+    registry = new_identity_registry()
+    df_json_drivers = get_driver_df(_json_data(), registry)
+
+    df_drivers, _, _ = parse_meta_data(LOG_LINES, df_json_drivers=df_json_drivers)
+
+    assert df_drivers["driver_key"].is_unique
+    assert df_drivers["driver_key"].tolist() == df_json_drivers["driver_key"].tolist()
+
+
+@pytest.mark.parametrize("known_host", [False, True])
+def test_shared_steam_id_gets_distinct_keys_without_json(known_host):
+    registry = new_identity_registry()
+    if known_host:
+        host_key = register_driver(registry, 76561197989276622, "Host", "ABC")
+
+    df_drivers, _, _ = parse_meta_data(LOG_LINES, registry)
+
+    assert df_drivers["driver_key"].is_unique
+    if known_host:
+        assert df_drivers.loc[0, "driver_key"] == host_key
+        assert registry["drivers"]["76561197989276622:0"]["name"] == "Host"
+
+    # parsing the same log again resolves to the same keys
+    df_again, _, _ = parse_meta_data(LOG_LINES, registry)
+    assert df_again["driver_key"].tolist() == df_drivers["driver_key"].tolist()
+
+
+def test_resolve_log_drivers_prefers_name_match_over_host_fallback():
+    registry = new_identity_registry()
+    host_key = register_driver(registry, 1, "Host", "ABC")
+
+    # the unknown player comes first but must not take the host's key
+    keys = resolve_log_drivers(registry, [(0, "1", "Guest"), (1, "1", "[ABC] Host")])
+
+    assert keys[1] == host_key
+    assert keys[0] != host_key
+
+
+def test_add_driver_keys_raises_for_unknown_driver():
+    df_drivers = pd.DataFrame({"driver_id": [0, 1], "driver_key": [5, 6]})
+    df = pd.DataFrame({"driver_id": [0, 1, 2]})
+
+    with pytest.raises(ValueError, match=r"\[2\]"):
+        add_driver_keys(df, df_drivers, "driver_id", "driver_id")
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+
+def find_event_pairs(input_dir: Path):
+    """
+    Returns a sorted list of (json_path, log_path) tuples for every
+    '<stem>.json' in input_dir that has a matching '<stem>.details.log'.
+    """
+    pairs = []
+
+    for json_path in sorted(Path(input_dir).glob("*.json")):
+        log_path = json_path.with_suffix(".details.log")
+        if log_path.exists():
+            pairs.append((json_path, log_path))
+
+    return pairs
@@ -0,0 +1,320 @@
+import json
+import pandas as pd
+from pathlib import Path
+
+# The identity registry is a plain dict that is persisted as json:
+# {
+#   "drivers": {
+#       "<identity>": {"key": 0, "steam_id": ..., "local_index": 0, "ai": False,
+#                      "name": ..., "clan": ..., "flag": ...,
+#                      "history": [[name, clan], ...]},
+#   },
+#   "vehicles": {
+#       "<vehicle guid>": {"key": 0, "name": ..., "history": [name, ...]},
+#   },
+# }
+# Split-screen and AI players share the steam id of the host, so a driver
+# identity is '<steam id>:<local index>' for humans and '<steam id>:ai:<name>'
+# for AI players (see driver_identity). Players only seen in log files without a
+# json can also get '<steam id>:log:<log name>' (see resolve_log_drivers).
+# Keys are small integers assigned in order of first appearance and never change,
+# so event tables can reference drivers and vehicles by key across events.
+# Clans are stored without brackets (like in the json files). The json files are
+# the source of truth for names, clans and flags; log files never change them.
+
+
+def new_identity_registry():
+    return {"drivers": {}, "vehicles": {}}
+
+
+def load_identity_registry(registry_path: Path):
+    """Loads the registry from registry_path or returns an empty one."""
+    registry_path = Path(registry_path)
+    if not registry_path.exists():
+        return new_identity_registry()
+
+    with open(registry_path, "r", encoding="utf-8") as file:
+        registry = json.load(file)
+
+    registry.setdefault("drivers", {})
+    registry.setdefault("vehicles", {})
+
+    return registry
+
+
+def save_identity_registry(registry: dict, registry_path: Path):
+    registry_path = Path(registry_path)
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(registry_path, "w", encoding="utf-8") as file:
+        json.dump(registry, file, ensure_ascii=False, indent=2)
+
+
+def driver_identity(steam_id, local_index: int = 0, ai: bool = False, name=None):
+    """Returns the registry identity string of a driver."""
+    if ai:
+        return f"{steam_id}:ai:{name}"
+    return f"{steam_id}:{local_index}"
+
+
+def _new_driver(registry: dict, steam_id, local_index: int, ai: bool):
+    return {
+        "key": len(registry["drivers"]),
+        "steam_id": str(steam_id),
+        "local_index": local_index,
+        "ai": ai,
+        "flag": None,
+        "history": [],
+    }
+
+
+def register_driver(
+    registry: dict,
+    steam_id,
+    name: str,
+    clan: str,
+    flag=None,
+    local_index: int = 0,
+    ai: bool = False,
+):
+    """
+    Adds or updates a driver from a json file and returns its driver key.
+    name/clan/flag become the current values, new name/clan combinations are
+    appended to the history.
+    """
+    drivers = registry["drivers"]
+    identity = driver_identity(steam_id, local_index, ai, name)
+    clan = clan or ""
+
+    driver = drivers.get(identity)
+    if driver is None:
+        driver = _new_driver(registry, steam_id, local_index, ai)
+        drivers[identity] = driver
+
+    driver["name"] = name
+    driver["clan"] = clan
+    if flag is not None:
+        driver["flag"] = flag
+    if [name, clan] not in driver["history"]:
+        driver["history"].append([name, clan])
+
+    return driver["key"]
+
+
+def register_vehicle(registry: dict, guid: str, name: str):
+    """Adds or updates the vehicle with guid and returns its vehicle key."""
+    vehicles = registry["vehicles"]
+
+    vehicle = vehicles.get(guid)
+    if vehicle is None:
+        vehicle = {"key": len(vehicles), "history": []}
+        vehicles[guid] = vehicle
+
+    vehicle["name"] = name
+    if name not in vehicle["history"]:
+        vehicle["history"].append(name)
+
+    return vehicle["key"]
+
+
+def split_team_and_name(full_name: str):
+    """
+    Heuristic split of a log player name '[TEAM] name' into ('[TEAM]', 'name').
+    Returns ('', full_name) if there is no team prefix.
+    """
+    if full_name.startswith("["):
+        team, _, name = full_name.partition(" ")
+        if name and team.endswith("]"):
+            return team, name
+    return "", full_name
+
+
+def _new_log_driver(registry: dict, identity: str, steam_id: str, full_name: str):
+    team, name = split_team_and_name(full_name)
+    driver = _new_driver(registry, steam_id, 0, False)
+    driver["name"] = name
+    driver["clan"] = team[1:-1]
+    registry["drivers"][identity] = driver
+    return driver["key"]
+
+
+def resolve_log_drivers(registry: dict, players):
+    """
+    Returns {driver_id: driver key} for the players of one log file, given as
+    a list of (driver_id, steam_id, full_name) with full_name like '[TEAM] name'.
+
+    Only use this if the json of the event is not available, otherwise map the
+    log driver_id to the json player index (see log_functions.parse_meta_data).
+
+    The log has no local index, so players are matched by name: first against
+    the name/clan history of the drivers known for the steam id, then the first
+    unmatched player of a steam id falls back to the only known driver or the
+    host (local index 0). No key is handed out twice within one log.
+
+    Known drivers are never modified. Players that still have no key get a new
+    entry with the heuristic name split and without history: '<steam id>:0' if
+    the steam id is unknown (a json file later fills in the real values), and
+    '<steam id>:log:<full_name>' for further players sharing that steam id.
+    """
+    drivers = registry["drivers"]
+    keys = {}
+    used_keys = set()
+
+    # 1) exact name matches, so fallbacks cannot take a key that matches later;
+    #    entries created from logs have no history yet, use their current name
+    for driver_id, steam_id, full_name in players:
+        steam_id = str(steam_id)
+        for driver in drivers.values():
+            if driver["steam_id"] != steam_id or driver["key"] in used_keys:
+                continue
+            names = driver["history"] or [[driver["name"], driver["clan"]]]
+            if any(
+                full_name == (f"[{clan}] {name}" if clan else name)
+                for name, clan in names
+            ):
+                keys[driver_id] = driver["key"]
+                used_keys.add(driver["key"])
+                break
+
+    # 2) renamed drivers and players unknown to the registry
+    steam_ids_with_key = {
+        driver["steam_id"] for driver in drivers.values() if driver["key"] in used_keys
+    }
+
+    for driver_id, steam_id, full_name in players:
+        if driver_id in keys:
+            continue
+        steam_id = str(steam_id)
+
+        key = None
+        if steam_id not in steam_ids_with_key:
+            candidates = [
+                driver
+                for driver in drivers.values()
+                if driver["steam_id"] == steam_id and driver["key"] not in used_keys
+            ]
+            hosts = [
+                driver
+                for driver in candidates
+                if not driver["ai"] and driver["local_index"] == 0
+            ]
+            if len(candidates) == 1:
+                key = candidates[0]["key"]
+            elif hosts:
+                key = hosts[0]["key"]
+            elif driver_identity(steam_id) not in drivers:
+                key = _new_log_driver(
+                    registry, driver_identity(steam_id), steam_id, full_name
+                )
+
+        if key is None:
+            identity = f"{steam_id}:log:{full_name}"
+            n = 1
+            while identity in drivers:
+                n += 1
+                identity = f"{steam_id}:log:{full_name}:{n}"
+            key = _new_log_driver(registry, identity, steam_id, full_name)
+
+        keys[driver_id] = key
+        used_keys.add(key)
+        steam_ids_with_key.add(steam_id)
+
+    return keys
+
+
+def add_driver_keys(
+    df: pd.DataFrame,
+    df_drivers: pd.DataFrame,
+    index_column: str = "driver_index",
+    drivers_index_column: str = "index",
+):
+    """
+    Returns a copy of df with a 'driver_key' column, looked up through
+    df_drivers (which needs drivers_index_column and driver_key columns).
+    Use index_column="driver_id", drivers_index_column="driver_id" for log tables.
+    Raises a ValueError if df references drivers missing from df_drivers.
+    """
+    key_by_index = df_drivers.set_index(drivers_index_column)["driver_key"]
+
+    driver_keys = df[index_column].map(key_by_index)
+    missing = sorted(df.loc[driver_keys.isna(), index_column].unique().tolist())
+    if missing:
+        raise ValueError(f"no driver_key for {index_column} {missing}")
+
+    df = df.copy()
+    df["driver_key"] = driver_keys.astype("int32")
+
+    return df
+
+
+def get_driver_dimension_df(registry: dict):
+    """
+    One row per driver key with steam_id, local_index, ai and the current name,
+    clan and flag. Text columns are categoricals to keep season-scale joins small.
+    """
+    columns = ["driver_key", "steam_id", "local_index", "ai", "name", "clan", "flag"]
+    rows = [
+        {
+            "driver_key": driver["key"],
+            "steam_id": driver["steam_id"],
+            "local_index": driver["local_index"],
+            "ai": driver["ai"],
+            "name": driver["name"],
+            "clan": driver["clan"],
+            "flag": driver["flag"],
+        }
+        for driver in registry["drivers"].values()
+    ]
+
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    df["driver_key"] = df["driver_key"].astype("int32")
+    for column in ["name", "clan", "flag"]:
+        df[column] = df[column].astype("category")
+
+    return df.sort_values("driver_key", ignore_index=True)
+
+
+def get_driver_history_df(registry: dict):
+    """One row per driver key and name/clan combination ever seen."""
+    rows = [
+        {"driver_key": driver["key"], "name": name, "clan": clan}
+        for driver in registry["drivers"].values()
+        for name, clan in driver["history"]
+    ]
+
+    df = pd.DataFrame.from_records(rows, columns=["driver_key", "name", "clan"])
+    df["driver_key"] = df["driver_key"].astype("int32")
+
+    return df
+
+
+def get_vehicle_dimension_df(registry: dict):
+    """One row per vehicle key with the vehicle guid and current name."""
+    rows = [
+        {"vehicle_key": vehicle["key"], "vehicle_guid": guid, "name": vehicle["name"]}
+        for guid, vehicle in registry["vehicles"].items()
+    ]
+
+    df = pd.DataFrame.from_records(rows, columns=["vehicle_key", "vehicle_guid", "name"])
+    df["vehicle_key"] = df["vehicle_key"].astype("int32")
+    df["name"] = df["name"].astype("category")
+
+    return df.sort_values("vehicle_key", ignore_index=True)
+
+
+if __name__ == "__main__":
+    from tsu_data.json_functions import read_event_json, get_driver_df
+    from tsu_data.log_functions import read_event_log, parse_meta_data
+
+    registry = new_identity_registry()
+
+    data = read_event_json("input_files/20250313_214747_AustralianGPv1.16_event.json")
+    lines = read_event_log(
+        "input_files/20250313_214747_AustralianGPv1.16_event.details.log"
+    )
+
+    df_drivers = get_driver_df(data, registry)
+    print(df_drivers)
+    print(parse_meta_data(lines, df_json_drivers=df_drivers)[0])
+    print(get_driver_dimension_df(registry))
+    print(get_vehicle_dimension_df(registry))
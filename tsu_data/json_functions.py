@@ -2,6 +2,8 @@ import json
 import pandas as pd
 from pathlib import Path
 
+from tsu_data.identity_functions import register_driver, register_vehicle
+
 
 def read_event_json(input_file_path: Path):
     with open(input_file_path, "r", encoding="utf-8") as file:
@@ -30,7 +32,13 @@ def get_event_series(data: dict):
     return pd.Series(event_dict)
 
 
-def get_driver_df(data: dict):
+def get_driver_df(data: dict, registry: dict = None):
+    """
+    One row per player. If an identity registry is given, all players and
+    vehicles are registered and the text columns (name, steam_id, clan, flag,
+    vehicle_name, vehicle_guid) are replaced by int driver_key/vehicle_key
+    columns, see identity_functions.get_driver_dimension_df.
+    """
     drivers = []
 
     for i, player in enumerate(data["players"]):
@@ -47,9 +55,29 @@ def get_driver_df(data: dict):
             "start_position": player["startPosition"],
         }
 
+        if registry is not None:
+            driver["driver_key"] = register_driver(
+                registry,
+                driver.pop("steam_id"),
+                driver.pop("name"),
+                driver.pop("clan"),
+                driver.pop("flag"),
+                local_index=driver["local_index"],
+                ai=driver["ai"],
+            )
+            driver["vehicle_key"] = register_vehicle(
+                registry, driver.pop("vehicle_guid"), driver.pop("vehicle_name")
+            )
+
         drivers.append(driver)
 
-    return pd.DataFrame.from_records(drivers)
+    df_drivers = pd.DataFrame.from_records(drivers)
+
+    if registry is not None:
+        df_drivers["driver_key"] = df_drivers["driver_key"].astype("int32")
+        df_drivers["vehicle_key"] = df_drivers["vehicle_key"].astype("int32")
+
+    return df_drivers
 
 
 def get_race_results_df(data: dict):
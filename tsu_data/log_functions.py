@@ -1,6 +1,8 @@
 import pandas as pd
 from pathlib import Path
 
+from tsu_data.identity_functions import resolve_log_drivers, split_team_and_name
+
 
 def read_event_log(input_file_path: Path):
     with open(input_file_path, "r", encoding="utf-8") as f:
@@ -8,10 +10,18 @@ def read_event_log(input_file_path: Path):
     return lines
 
 
-def parse_meta_data(lines):
+def parse_meta_data(
+    lines, registry: dict = None, df_json_drivers: pd.DataFrame = None
+):
     """
     Reads driver data, tire compounds, and MaxFuel.
     Returns: (df_drivers, df_compounds, max_fuel).
+
+    If df_json_drivers (json_functions.get_driver_df of the same event, called
+    with a registry) is given, the log driver_id is mapped to the json player
+    index and df_drivers has an int driver_key column instead of
+    steam_id/team/name. Without the json, a registry can be given instead and
+    the players are resolved by name (see identity_functions.resolve_log_drivers).
     """
     driver_data = []
     compounds = {}
@@ -40,20 +50,14 @@ def parse_meta_data(lines):
             continue
 
         if parse_mode == "players":
-            parts = raw.split(maxsplit=4)
+            parts = raw.split(maxsplit=3)
             if len(parts) < 4:
                 continue
             try:
                 driver_id = int(parts[0])
                 steam_id = parts[1]
                 # parts[2] is just a zero we do not need
-                if parts[3].startswith("["):
-                    team = parts[3]
-                    name = parts[4]
-                else:
-                    team = ""
-                    name = parts[3]
-                driver_data.append([driver_id, steam_id, team, name])
+                driver_data.append([driver_id, steam_id, parts[3]])
             except ValueError:
                 pass
 
@@ -74,9 +78,28 @@ def parse_meta_data(lines):
             except ValueError:
                 pass
 
-    df_drivers = pd.DataFrame(
-        driver_data, columns=["driver_id", "steam_id", "team", "name"]
-    )
+    if df_json_drivers is not None or registry is not None:
+        if df_json_drivers is not None:
+            # the log player index is the index in the json players list
+            key_by_driver_id = dict(
+                zip(df_json_drivers["index"], df_json_drivers["driver_key"])
+            )
+            missing = [d for d, _, _ in driver_data if d not in key_by_driver_id]
+            if missing:
+                raise ValueError(f"log players {missing} are missing in the json")
+        else:
+            key_by_driver_id = resolve_log_drivers(registry, driver_data)
+
+        df_drivers = pd.DataFrame(
+            [[d, key_by_driver_id[d]] for d, _, _ in driver_data],
+            columns=["driver_id", "driver_key"],
+        )
+        df_drivers["driver_key"] = df_drivers["driver_key"].astype("int32")
+    else:
+        df_drivers = pd.DataFrame(
+            [[d, steam_id, *split_team_and_name(n)] for d, steam_id, n in driver_data],
+            columns=["driver_id", "steam_id", "team", "name"],
+        )
 
     df_compounds = pd.DataFrame.from_dict(compounds, orient="index")
 
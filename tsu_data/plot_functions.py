@@ -0,0 +1,258 @@
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import seaborn as sns
+
+# charts are drawn on plain Figure objects (not pyplot), which render through
+# Agg on savefig without touching the global matplotlib backend
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
+
+from tsu_data import json_functions, log_functions
+from tsu_data.file_functions import find_event_pairs
+
+# bump this whenever the look of the charts changes so cached charts get redrawn
+CHARTS_VERSION = "1"
+
+
+def _driver_labels_from_json(df_drivers: pd.DataFrame):
+    """Maps json driver index -> '[CLAN] name' (or just name without clan)."""
+    labels = {}
+    for _, row in df_drivers.iterrows():
+        labels[row["index"]] = (
+            f"[{row['clan']}] {row['name']}" if row["clan"] else row["name"]
+        )
+    return labels
+
+
+def _driver_labels_from_log(df_drivers: pd.DataFrame):
+    """Maps log driver_id -> '[TEAM] name' (or just name without team)."""
+    labels = {}
+    for _, row in df_drivers.iterrows():
+        labels[row["driver_id"]] = (
+            f"{row['team']} {row['name']}" if row["team"] else row["name"]
+        )
+    return labels
+
+
+def _new_figure(title: str):
+    fig = Figure(figsize=(14, 8), layout="constrained")
+    ax = fig.subplots()
+    ax.set_title(title)
+    return fig, ax
+
+
+def _move_legend_outside(ax):
+    if ax.get_legend() is not None:
+        sns.move_legend(
+            ax, "upper left", bbox_to_anchor=(1.01, 1), frameon=False, title=None
+        )
+
+
+def plot_lap_times(df_lap_results: pd.DataFrame, df_drivers: pd.DataFrame):
+    """
+    Line chart of lap time (seconds) per lap and driver.
+    Expects the output of extract_lap_results_from_cps and get_driver_df.
+    """
+    df = df_lap_results.copy()
+    df["driver"] = df["driver_index"].map(_driver_labels_from_json(df_drivers))
+
+    fig, ax = _new_figure("Lap times")
+    sns.lineplot(data=df, x="lap", y="lap_time", hue="driver", ax=ax, linewidth=1)
+
+    # pit stops and crashes would squash all regular laps into a flat line
+    if not df.empty:
+        ax.set_ylim(
+            df["lap_time"].min() * 0.99, df["lap_time"].quantile(0.9) * 1.05
+        )
+
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Lap time [s]")
+    _move_legend_outside(ax)
+
+    return fig
+
+
+def plot_positions(df_lap_results: pd.DataFrame, df_drivers: pd.DataFrame):
+    """
+    Position chart (position at the end of each lap) per driver.
+    Expects the output of extract_lap_results_from_cps and get_driver_df.
+    """
+    df = df_lap_results.copy()
+    df["driver"] = df["driver_index"].map(_driver_labels_from_json(df_drivers))
+
+    fig, ax = _new_figure("Positions")
+    sns.lineplot(
+        data=df, x="lap", y="position_end", hue="driver", ax=ax, linewidth=1.5
+    )
+
+    ax.invert_yaxis()
+    ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Position")
+    _move_legend_outside(ax)
+
+    return fig
+
+
+def plot_tire_wear(df_details: pd.DataFrame, df_drivers: pd.DataFrame):
+    """
+    Tire condition (percentage at the end of each lap) per driver.
+    Expects the output of get_details_df and parse_meta_data.
+    """
+    df = df_details.copy()
+    df["driver"] = df["driver_id"].map(_driver_labels_from_log(df_drivers))
+
+    fig, ax = _new_figure("Tire condition")
+    sns.lineplot(
+        data=df, x="lap", y="tire_perc_end", hue="driver", ax=ax, linewidth=1
+    )
+
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Tire condition at end of lap [%]")
+    _move_legend_outside(ax)
+
+    return fig
+
+
+def hash_file(input_file_path: Path):
+    """Returns a sha256 hex digest of the file content and CHARTS_VERSION."""
+    h = hashlib.sha256(CHARTS_VERSION.encode())
+    with open(input_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def render_event_charts(
+    json_path: Path,
+    log_path: Path,
+    output_dir: Path = Path("output_files"),
+    force: bool = False,
+):
+    """
+    Renders lap time, position and tire condition charts for one event into
+    output_dir as '<json stem>.<chart>.png'.
+
+    The hash of the input file each chart is built from is stored in
+    '<json stem>.charts.json'. Charts whose input hash did not change (and whose
+    png still exists) are skipped unless force is set, and the input files are
+    only parsed when at least one of their charts has to be redrawn.
+
+    Returns the list of written png paths.
+    """
+    json_path = Path(json_path)
+    log_path = Path(log_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = output_dir / (json_path.stem + ".charts.json")
+    manifest = {}
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+
+    json_hash = hash_file(json_path)
+    log_hash = hash_file(log_path)
+
+    # chart suffix -> (input hash, source)
+    charts = {
+        ".lap-times.png": (json_hash, "json"),
+        ".positions.png": (json_hash, "json"),
+        ".tire-wear.png": (log_hash, "log"),
+    }
+
+    stale = {
+        suffix
+        for suffix, (input_hash, _) in charts.items()
+        if force
+        or manifest.get(suffix) != input_hash
+        or not (output_dir / (json_path.stem + suffix)).exists()
+    }
+    stale_sources = {charts[suffix][1] for suffix in stale}
+
+    figures = {}
+
+    if "json" in stale_sources:
+        data = json_functions.read_event_json(json_path)
+        df_drivers = json_functions.get_driver_df(data)
+        df_checkpoint_results = json_functions.get_checkpoint_results_df(data)
+        df_lap_results = json_functions.extract_lap_results_from_cps(
+            df_checkpoint_results, df_drivers
+        )
+        figures[".lap-times.png"] = lambda: plot_lap_times(df_lap_results, df_drivers)
+        figures[".positions.png"] = lambda: plot_positions(df_lap_results, df_drivers)
+
+    if "log" in stale_sources:
+        lines = log_functions.read_event_log(log_path)
+        df_log_drivers, df_compounds, max_fuel = log_functions.parse_meta_data(lines)
+        df_events, start_pos_by_driver_id = log_functions.parse_events(
+            lines, df_compounds, max_fuel
+        )
+        df_details = log_functions.get_details_df(df_events, start_pos_by_driver_id)
+        figures[".tire-wear.png"] = lambda: plot_tire_wear(df_details, df_log_drivers)
+
+    written = []
+
+    for suffix in sorted(stale):
+        output_file_path = output_dir / (json_path.stem + suffix)
+        fig = figures[suffix]()
+        fig.savefig(output_file_path, dpi=100)
+        manifest[suffix] = charts[suffix][0]
+        written.append(output_file_path)
+
+    if written:
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+
+    return written
+
+
+def _render_event_charts_args(args):
+    json_path, log_path, output_dir, force = args
+    # one broken event must not abort the whole batch
+    try:
+        written = render_event_charts(json_path, log_path, output_dir, force)
+    except Exception as e:
+        return json_path, [], repr(e)
+    return json_path, written, None
+
+
+def render_charts_batch(
+    pairs,
+    output_dir: Path = Path("output_files"),
+    max_workers: int = None,
+    force: bool = False,
+):
+    """
+    Renders the charts of many (json_path, log_path) pairs on a process pool.
+    Returns (results, errors): results is a dict {json_path: [written png paths]}
+    for all events that rendered, errors a dict {json_path: error description}
+    for the events that failed.
+    """
+    jobs = [(json_path, log_path, output_dir, force) for json_path, log_path in pairs]
+    results = {}
+    errors = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for json_path, written, error in executor.map(
+            _render_event_charts_args, jobs
+        ):
+            if error is not None:
+                errors[json_path] = error
+            else:
+                results[json_path] = written
+
+    return results, errors
+
+
+if __name__ == "__main__":
+    pairs = find_event_pairs(Path("input_files"))
+    results, errors = render_charts_batch(pairs)
+    for json_path, written in results.items():
+        print(json_path.name, [p.name for p in written])
+    for json_path, error in errors.items():
+        print(json_path.name, error)
@@ -0,0 +1,209 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# This module deliberately avoids pandas: it only extracts the handful of facts
+# needed to check that a .json and a .details.log describe the same event.
+
+
+def extract_json_facts(input_file_path: Path):
+    """
+    Reads only the fields of the event json needed for validation.
+    Returns a dict with:
+      steam_ids:    {player index: steam id as string}
+      laps:         {player index: laps completed}
+      finished:     {player index, ...} of drivers that crossed the finish
+                    line (lastCheckpoint 0)
+      finish_order: [player index, ...] as listed in raceRanking
+    """
+    with open(input_file_path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    steam_ids = {
+        i: str(player["player"]["id"]) for i, player in enumerate(data["players"])
+    }
+
+    entries = data["raceStats"]["raceRanking"]["entries"]
+    laps = {entry["playerIndex"]: entry["lapsCompleted"] for entry in entries}
+    finished = {
+        entry["playerIndex"] for entry in entries if entry["lastCheckpoint"] == 0
+    }
+    finish_order = [entry["playerIndex"] for entry in entries]
+
+    return {
+        "steam_ids": steam_ids,
+        "laps": laps,
+        "finished": finished,
+        "finish_order": finish_order,
+    }
+
+
+def extract_log_facts(input_file_path: Path):
+    """
+    Scans the details log once and keeps only the player section plus the
+    'Lap' and 'Finished' events. Returns the same dict layout as
+    extract_json_facts. The finish order is built from the 'Finished' events
+    sorted by laps completed (descending) and time (ascending). Drivers
+    without a 'Finished' event are not part of finished/finish_order, and
+    drivers without any 'Lap' event have 0 laps.
+    """
+    steam_ids = {}
+    laps = {}
+    finished = []
+    parse_mode = None
+
+    with open(input_file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if parse_mode == "events":
+                # only split the two event types we care about
+                if " Lap " not in line and " Finished " not in line:
+                    continue
+                parts = line.split(maxsplit=4)
+                if len(parts) < 4:
+                    continue
+                try:
+                    time_ = int(parts[0])
+                    drv = int(parts[2])
+                    laps_ = int(parts[3])
+                except ValueError:
+                    continue
+                # laps completed only ever increases, so the last value wins
+                laps[drv] = laps_
+                if parts[1] == "Finished":
+                    finished.append((-laps_, time_, drv))
+                continue
+
+            raw = line.strip()
+            if raw.startswith("PlayerCount"):
+                parse_mode = "players"
+                continue
+            if raw.startswith("TireCompoundCount") or raw.startswith("MaxFuel"):
+                parse_mode = None
+                continue
+            if raw.startswith("Events"):
+                parse_mode = "events"
+                continue
+
+            if parse_mode != "players" or not raw or raw.startswith("#"):
+                continue
+
+            parts = raw.split(maxsplit=2)
+            if len(parts) < 2:
+                continue
+            try:
+                drv = int(parts[0])
+            except ValueError:
+                continue
+            steam_ids[drv] = parts[1]
+            # drivers retiring on the first lap never get a 'Lap' event
+            laps[drv] = 0
+
+    finish_order = [drv for _, _, drv in sorted(finished)]
+
+    return {
+        "steam_ids": steam_ids,
+        "laps": laps,
+        "finished": {drv for _, _, drv in finished},
+        "finish_order": finish_order,
+    }
+
+
+def compare_event_facts(json_facts: dict, log_facts: dict):
+    """
+    Compares the facts of both files and returns a list of human readable
+    mismatch descriptions. An empty list means both files agree.
+    """
+    mismatches = []
+
+    json_ids = json_facts["steam_ids"]
+    log_ids = log_facts["steam_ids"]
+
+    if len(json_ids) != len(log_ids):
+        mismatches.append(
+            f"driver count differs: json={len(json_ids)} log={len(log_ids)}"
+        )
+
+    for idx in sorted(set(json_ids) | set(log_ids)):
+        if json_ids.get(idx) != log_ids.get(idx):
+            mismatches.append(
+                f"steam id of player {idx} differs: "
+                f"json={json_ids.get(idx)} log={log_ids.get(idx)}"
+            )
+
+    json_laps = json_facts["laps"]
+    log_laps = log_facts["laps"]
+
+    for idx in sorted(set(json_laps) | set(log_laps)):
+        if json_laps.get(idx) != log_laps.get(idx):
+            mismatches.append(
+                f"laps completed of player {idx} differ: "
+                f"json={json_laps.get(idx)} log={log_laps.get(idx)}"
+            )
+
+    json_finished = json_facts["finished"]
+    log_finished = log_facts["finished"]
+
+    if json_finished != log_finished:
+        mismatches.append(
+            f"finishers differ: json only={sorted(json_finished - log_finished)} "
+            f"log only={sorted(log_finished - json_finished)}"
+        )
+
+    # raceRanking sorts by laps first, so drivers that did not finish can be
+    # ranked between finishers; only compare the order of the log's finishers
+    log_order = log_facts["finish_order"]
+    json_order = [idx for idx in json_facts["finish_order"] if idx in log_finished]
+
+    if json_order != log_order:
+        mismatches.append(f"finish order differs: json={json_order} log={log_order}")
+
+    return mismatches
+
+
+def validate_event_pair(json_path: Path, log_path: Path):
+    """
+    Validates one json/log pair. Returns (json_path, mismatches). Files that
+    cannot be read or parsed are reported as a single mismatch.
+    """
+    try:
+        json_facts = extract_json_facts(json_path)
+        log_facts = extract_log_facts(log_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return json_path, [f"could not read files: {e!r}"]
+
+    return json_path, compare_event_facts(json_facts, log_facts)
+
+
+def _validate_event_pair_args(pair):
+    return validate_event_pair(*pair)
+
+
+def validate_event_pairs(pairs, max_workers: int = None):
+    """
+    Validates many (json_path, log_path) pairs on a process pool.
+    Returns a dict {json_path: mismatches} containing only the pairs that
+    have at least one mismatch.
+    """
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for json_path, mismatches in executor.map(
+            _validate_event_pair_args, pairs, chunksize=16
+        ):
+            if mismatches:
+                results[json_path] = mismatches
+
+    return results
+
+
+if __name__ == "__main__":
+    json_facts = extract_json_facts(
+        "input_files/20240624_Oschersleben_F3Genesis_event.json"
+    )
+    log_facts = extract_log_facts(
+        "input_files/20240624_Oschersleben_F3Genesis_event.details.log"
+    )
+
+    print(json_facts)
+    print(log_facts)
+    print(compare_event_facts(json_facts, log_facts))
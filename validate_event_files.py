@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+from tsu_data.file_functions import *
+from tsu_data.validation_functions import *
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: uv run validate_event_files.py <path_to_input_dir> [workers]")
+        sys.exit(1)
+
+    input_dir = Path(sys.argv[1])
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    pairs = find_event_pairs(input_dir)
+    results = validate_event_pairs(pairs, max_workers=max_workers)
+
+    for json_path, mismatches in results.items():
+        print(json_path.name)
+        for mismatch in mismatches:
+            print("  " + mismatch)
+
+    print(f"{len(pairs)} event(s) checked, {len(results)} with mismatches")
+
+    if results:
+        sys.exit(1)